@@ -11,10 +11,17 @@ from rich.markdown import Markdown
 from rich.panel import Panel
 
 from tools.summarizer import summarize_text, summarize_topic
-from tools.quiz_generator import generate_quiz, generate_flashcards
+from tools.quiz_generation import generate_quiz, generate_flashcards
 from tools.habit_tracker import track_activity, get_progress, clear_tracker
-from tools.pdf_parser import parse_pdf
+from tools.study_analytics import load_history, build_report, summarize_progress
+from tools.incremental_summarizer import summarize_pdf_incremental
+from tools.stream_summarizer import summarize_pdf_streaming
 from tools.youtube_parser import parse_youtube
+from tools.session_memory import SessionMemory
+from tools.prefetch import Prefetcher
+
+# Topics the classifier may return when the user just points at earlier content
+REFERENCE_WORDS = {"", "that", "this", "it", "these", "those", "the above"}
 
 # Initialize Rich console for beautiful output
 console = Console()
@@ -36,6 +43,16 @@ class StudyAssistantAI:
         
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel('gemini-2.5-flash')
+        self.memory = SessionMemory(
+            self.model,
+            max_tokens=int(os.getenv("SESSION_MAX_TOKENS", "2000"))
+        )
+        # PDFs larger than this file size are summarized page by page (0 disables)
+        self.pdf_streaming_threshold_mb = int(os.getenv("PDF_STREAMING_THRESHOLD_MB", "0"))
+        # Intermediate summaries kept in memory before spilling to a temporary file
+        self.pdf_spill_mb = int(os.getenv("PDF_SPILL_MB", "16"))
+        # Background quiz/flashcard generations allowed per session (0 disables prefetch)
+        self.prefetcher = Prefetcher(self.model, budget=int(os.getenv("PREFETCH_BUDGET", "0")))
         
         console.print("[bold green]✅ StudyAssistantAI initialized successfully![/bold green]\n")
     
@@ -50,6 +67,9 @@ class StudyAssistantAI:
 You are an intent classifier for a study assistant AI.
 Given the user input, determine the intent and extract relevantṇ information.
 
+Conversation so far:
+{self.memory.get_context() or "(new session)"}
+
 User Input: "{user_input}"
 
 Classify into one of these intents:
@@ -70,7 +90,10 @@ Respond ONLY with JSON in this format:
     "url": "extracted URL if any",
     "file_path": "extracted file path if any",
     "hours": "extracted hours if mentioned",
-    "task": "extracted task if mentioned"
+    "task": "extracted task if mentioned",
+    "subject": "school subject of the task if mentioned (e.g. Math, Biology)",
+    "quiz_type": "flashcards if the user only wants flashcards, else quiz",
+    "refers_to_previous": "true if the user refers to earlier content (e.g. 'that', 'this'), else false"
 }}
 """
         
@@ -101,22 +124,53 @@ Respond ONLY with JSON in this format:
         intent = intent_data.get("intent", "GENERAL_QUERY")
         
         console.print(f"[dim]🧠 Detected intent: {intent}[/dim]\n")
+        self.memory.add_turn("user", user_input)
+        
+        if intent != "GENERATE_QUIZ":
+            # The user moved on, so prefetched follow-ups are unlikely to be used
+            self.prefetcher.cancel()
         
         # Route to appropriate tool
         if intent == "SUMMARIZE_TEXT":
             text = intent_data.get("text") or user_input
             result = summarize_text(self.model, text)
             self.display_result(result)
+            self.remember_result(result, "pasted text", text)
         
         elif intent == "SUMMARIZE_TOPIC":
             topic = intent_data.get("topic") or user_input
             result = summarize_topic(self.model, topic)
             self.display_result(result)
+            self.remember_result(result, topic, prefetch=True)
         
         elif intent == "GENERATE_QUIZ":
-            topic = intent_data.get("topic") or user_input
-            result = generate_quiz(self.model, topic)
+            given_topic = (intent_data.get("topic") or "").strip()
+            topic = given_topic or user_input
+            kind = "flashcards" if intent_data.get("quiz_type") == "flashcards" else "quiz"
+            source = None
+            result = None
+            doc = self.memory.get_document()
+            same_topic = doc and given_topic.lower() == doc["source"].strip().lower()
+            # "that" / "this" name the previous content rather than a narrower topic
+            no_topic = given_topic.lower() in REFERENCE_WORDS
+            if doc and (same_topic or str(intent_data.get("refers_to_previous")).lower() == "true"):
+                # Reuse the stored summary instead of asking for the content again
+                source = doc["summary"] or doc["text"][:10000]
+                if same_topic or no_topic:
+                    topic = doc["source"]
+                    result = self.prefetcher.get(kind, self.memory.last_doc_id)
+                    if result:
+                        console.print("[dim]⚡ Ready from prefetch[/dim]\n")
+            else:
+                # A quiz on something else: prefetched work won't be used
+                self.prefetcher.record_miss()
+                self.prefetcher.cancel()
+            if result is None:
+                generate = generate_flashcards if kind == "flashcards" else generate_quiz
+                result = generate(self.model, topic, source=source)
             self.display_result(result)
+            self.memory.add_turn("assistant", f"Generated {kind} on {topic}",
+                                 doc_id=self.memory.last_doc_id if source else None)
         
         elif intent == "TRACK_HABIT":
             task = intent_data.get("task") or user_input
@@ -126,13 +180,21 @@ Respond ONLY with JSON in this format:
                     hours = float(hours)
                 except:
                     hours = None
-            result = track_activity(task, hours)
+            result = track_activity(task, hours, subject=intent_data.get("subject") or None)
             console.print(Panel(result.get("message", "Tracked!"), 
                               title="📊 Habit Tracker", style="green"))
+            self.memory.add_turn("assistant", result.get("message", "Tracked!"))
         
         elif intent == "SHOW_PROGRESS":
-            result = get_progress()
-            self.display_progress(result)
+            # Columnar history is cached until the tracker file changes
+            history = load_history()
+            result = summarize_progress(history)
+            report = build_report(
+                history,
+                weekly_goal_hours=float(os.getenv("WEEKLY_GOAL_HOURS", "10"))
+            )
+            self.display_progress(result, report)
+            self.memory.add_turn("assistant", "Showed study progress")
         
         elif intent == "PARSE_PDF":
             file_path = intent_data.get("file_path") or user_input
@@ -149,14 +211,21 @@ Respond ONLY with JSON in this format:
                     console.print(f"[red]❌ File not found: {file_path}[/red]")
                     console.print("[yellow]💡 Tip: Drag and drop the PDF file or provide the full path[/yellow]")
                 else:
-                    pdf_result = parse_pdf(file_path)
-                    if pdf_result.get("success"):
-                        # Summarize the PDF content
-                        console.print(f"[green]📄 Extracted {pdf_result['num_pages']} pages[/green]\n")
-                        result = summarize_text(self.model, pdf_result["text"][:10000])  # Limit text
+                    threshold_mb = self.pdf_streaming_threshold_mb
+                    if threshold_mb and os.path.getsize(file_path) > threshold_mb * 1024 * 1024:
+                        result = summarize_pdf_streaming(self.model, file_path, spill_mb=self.pdf_spill_mb)
+                        pages_note = "streamed page by page"
+                    else:
+                        # Only pages changed since the last run are extracted and summarized again
+                        result = summarize_pdf_incremental(self.model, file_path)
+                        pages_note = f"{result.get('changed_pages', 0)} new or changed"
+                    if result.get("success"):
+                        console.print(f"[green]📄 Processed {result['num_pages']} pages "
+                                      f"({pages_note})[/green]\n")
                         self.display_result(result)
+                        self.remember_result(result, file_path, doc_id=result.get("doc_id"), prefetch=True)
                     else:
-                        console.print(f"[red]❌ Error: {pdf_result.get('error')}[/red]")
+                        console.print(f"[red]❌ Error: {result.get('error')}[/red]")
             else:
                 console.print("[yellow]⚠️ Please provide the PDF file path[/yellow]")
         
@@ -175,6 +244,7 @@ Respond ONLY with JSON in this format:
                     console.print(f"[green]📺 Extracted transcript ({yt_result['duration']:.0f}s)[/green]\n")
                     result = summarize_text(self.model, yt_result["transcript"])
                     self.display_result(result)
+                    self.remember_result(result, url, yt_result["transcript"])
                 else:
                     console.print(f"[red]❌ Error: {yt_result.get('error')}[/red]")
                     console.print("[yellow]💡 Tip: Make sure the video has captions/subtitles enabled[/yellow]")
@@ -182,10 +252,43 @@ Respond ONLY with JSON in this format:
                 console.print("[yellow]⚠️ Please provide a YouTube URL[/yellow]")
         
         else:
-            # General query - direct to Gemini
-            response = self.model.generate_content(user_input)
+            # General query - direct to Gemini, with the bounded session context
+            # The stored turn is truncated, so send the user's message in full
+            context = self.memory.get_context(include_latest=False)
+            prompt = f"{context}\n\nUser: {user_input}\n\nAnswer the latest user message." if context else user_input
+            response = self.model.generate_content(prompt)
             console.print(Panel(Markdown(response.text), 
                               title="💡 Response", style="cyan"))
+            self.memory.add_turn("assistant", response.text)
+    
+    def remember_result(self, result: dict, source: str, text: str = "", doc_id: str = None,
+                        prefetch: bool = False):
+        """
+        Store a summarized document in session memory and log the turn
+        
+        Args:
+            result: Result dict returned by a summarizer tool
+            source: Where the content came from
+            text: Full parsed text (stored once, referenced by ID afterwards)
+            doc_id: Explicit document ID (optional)
+            prefetch: Start generating a quiz and flashcards for it in the background
+        """
+        content = result.get("content", "")
+        doc_id = self.memory.add_document(source, text=text, summary=content, doc_id=doc_id)
+        self.memory.add_turn("assistant", content, doc_id=doc_id)
+        if prefetch:
+            self.prefetcher.schedule(doc_id, source, source=content)
+    
+    def display_prefetch_stats(self):
+        """Display how often prefetched results were used"""
+        if not self.prefetcher.enabled:
+            return
+        stats = self.prefetcher.stats()
+        console.print(
+            f"[dim]⚡ Prefetch: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.0%} hit rate), {stats['wasted']} unused, "
+            f"{stats['spent']}/{stats['budget']} budget used[/dim]"
+        )
     
     def display_result(self, result: dict):
         """Display formatted result"""
@@ -202,8 +305,8 @@ Respond ONLY with JSON in this format:
         title = title_map.get(result_type, "📋 Result")
         console.print(Panel(Markdown(content), title=title, style="blue"))
     
-    def display_progress(self, progress: dict):
-        """Display study progress"""
+    def display_progress(self, progress: dict, report: dict = None):
+        """Display study progress and analytics"""
         total_tasks = progress.get("total_tasks", 0)
         total_hours = progress.get("total_hours", 0)
         entries = progress.get("entries", [])
@@ -215,6 +318,23 @@ Respond ONLY with JSON in this format:
             style="green"
         ))
         
+        if report and report.get("total_entries"):
+            weekly = " | ".join(f"{h:.1f}h" for h in report["weekly_hours"])
+            subjects = "\n".join(
+                f"  • {s['subject']}: {s['hours']:.1f}h ({s['share']:.0%})"
+                for s in report["subjects"][:5]
+            )
+            console.print(Panel(
+                f"[bold]Current Streak:[/bold] {report['current_streak']} days "
+                f"(longest {report['longest_streak']})\n"
+                f"[bold]Last 7 Days:[/bold] {report['last_7_days_hours']:.1f}h of "
+                f"{report['weekly_goal_hours']:.0f}h goal ({report['goal_progress']:.0%})\n"
+                f"[bold]Weekly Hours:[/bold] {weekly}\n"
+                f"[bold]Top Subjects:[/bold]\n{subjects or '  • none yet'}",
+                title="📈 Study Analytics",
+                style="magenta"
+            ))
+        
         if entries:
             console.print("\n[bold]Recent Activities:[/bold]")
             for entry in entries[-10:]:  # Show last 10
@@ -244,6 +364,7 @@ Respond ONLY with JSON in this format:
                     continue
                 
                 if user_input.lower() in ['exit', 'quit', 'bye']:
+                    self.display_prefetch_stats()
                     console.print("[bold green]👋 Happy studying![/bold green]")
                     break
                 
@@ -251,7 +372,9 @@ Respond ONLY with JSON in this format:
                 self.handle_request(user_input)
                 
             except KeyboardInterrupt:
-                console.print("\n[bold green]👋 Happy studying![/bold green]")
+                console.print()
+                self.display_prefetch_stats()
+                console.print("[bold green]👋 Happy studying![/bold green]")
                 break
             except Exception as e:
                 console.print(f"[red]❌ Error: {str(e)}[/red]")
@@ -259,4 +382,7 @@ Respond ONLY with JSON in this format:
 
 if __name__ == "__main__":
     agent = StudyAssistantAI()
-    agent.run()
+    try:
+        agent.run()
+    finally:
+        agent.prefetcher.shutdown()
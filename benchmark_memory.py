@@ -0,0 +1,117 @@
+"""
+Benchmark for the streaming PDF mode
+Checks that peak memory stays flat as the page count grows
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+PAGE_COUNTS = [100, 400, 1600, 6400]
+# pypdf still keeps its cross-reference table, read when the file is opened
+# (about 0.7 KB per page here, ~4.5 MB from 100 to 6400 pages). Keeping the
+# page objects themselves, as reader.pages does, grows ~28 MB and fails this.
+MAX_GROWTH_MB = 8
+LINES_PER_PAGE = 40
+
+
+class OfflineModel:
+    """Stands in for Gemini so the benchmark needs no API key or network"""
+
+    class Response:
+        def __init__(self, text):
+            self.text = text
+
+    def generate_content(self, prompt):
+        return self.Response("- " + prompt[-400:].replace("\n", " "))
+
+
+def make_pdf(path: str, num_pages: int):
+    """Write a simple text PDF with the given number of pages"""
+    with open(path, 'wb') as f:
+        offsets = []
+
+        def write_object(number, body: bytes):
+            offsets.append(f.tell())
+            f.write(f"{number} 0 obj\n".encode() + body + b"\nendobj\n")
+
+        f.write(b"%PDF-1.4\n")
+        kids = " ".join(f"{4 + 2 * i} 0 R" for i in range(num_pages))
+        write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {num_pages} >>".encode())
+        write_object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+        for i in range(num_pages):
+            lines = [f"(Page {i + 1} line {n}: the mitochondria is the powerhouse of the cell) Tj T*"
+                     for n in range(LINES_PER_PAGE)]
+            stream = ("BT /F1 10 Tf 12 TL 40 760 Td " + " ".join(lines) + " ET").encode()
+            write_object(4 + 2 * i, b"<< /MediaBox [0 0 612 792] /Type /Page /Parent 2 0 R "
+                                    b"/Resources << /Font << /F1 3 0 R >> >> "
+                                    + f"/Contents {5 + 2 * i} 0 R >>".encode())
+            write_object(5 + 2 * i, f"<< /Length {len(stream)} >>\nstream\n".encode()
+                         + stream + b"\nendstream")
+
+        xref = f.tell()
+        f.write(f"xref\n0 {len(offsets) + 1}\n0000000000 65535 f \n".encode())
+        for offset in offsets:
+            f.write(f"{offset:010d} 00000 n \n".encode())
+        f.write(f"trailer\n<< /Size {len(offsets) + 1} /Root 1 0 R >>\n"
+                f"startxref\n{xref}\n%%EOF\n".encode())
+
+
+def run_once(pdf_path: str, mode: str):
+    """Process one PDF and print the peak RSS of this process in MB"""
+    if mode == "streaming":
+        from tools.stream_summarizer import summarize_pdf_streaming
+        result = summarize_pdf_streaming(OfflineModel(), pdf_path, spill_mb=1)
+        assert result["success"], result.get("error")
+    else:
+        from tools.pdf_parser import parse_pdf
+        result = parse_pdf(pdf_path)
+        assert result["success"], result.get("error")
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(peak_kb / 1024)
+
+
+def measure(pdf_path: str, mode: str) -> float:
+    """Run one measurement in a fresh process so peaks don't carry over"""
+    output = subprocess.run(
+        [sys.executable, __file__, "--run", pdf_path, mode],
+        capture_output=True, text=True, check=True
+    )
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    print("=" * 60)
+    print("StudyAssistantAI - Streaming PDF Memory Benchmark")
+    print("=" * 60)
+
+    peaks = {"streaming": [], "full": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_pages in PAGE_COUNTS:
+            pdf_path = os.path.join(tmp, f"book_{num_pages}.pdf")
+            make_pdf(pdf_path, num_pages)
+            size_mb = os.path.getsize(pdf_path) / (1024 * 1024)
+
+            for mode in peaks:
+                peaks[mode].append(measure(pdf_path, mode))
+
+            print(f"{num_pages:>6} pages ({size_mb:5.1f} MB): "
+                  f"streaming {peaks['streaming'][-1]:7.1f} MB peak RSS, "
+                  f"parse_pdf {peaks['full'][-1]:7.1f} MB peak RSS")
+
+    growth = max(peaks["streaming"]) - min(peaks["streaming"])
+    print(f"\nStreaming peak RSS growth: {growth:.1f} MB (limit {MAX_GROWTH_MB} MB)")
+    assert growth < MAX_GROWTH_MB, "Peak memory grows with page count in streaming mode"
+    print("✅ Peak memory stays flat as page count grows")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--run":
+        run_once(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -8,7 +8,7 @@ from dotenv import load_dotenv
 import google.generativeai as genai
 
 from tools.summarizer import summarize_topic
-from tools.quiz_generator import generate_quiz
+from tools.quiz_generation import generate_quiz
 from tools.habit_tracker import track_activity, get_progress
 
 # Load environment variables
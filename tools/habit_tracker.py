@@ -24,7 +24,8 @@ def save_tracker(data):
         json.dump(data, f, indent=2)
 
 
-def track_activity(task: str, hours: float = None, status: str = "completed") -> dict:
+def track_activity(task: str, hours: float = None, status: str = "completed",
+                   subject: str = None) -> dict:
     """
     Track a study activity
     
@@ -32,15 +33,19 @@ def track_activity(task: str, hours: float = None, status: str = "completed") ->
         task: Task description
         hours: Hours spent (optional)
         status: Status of task (completed/in_progress)
+        subject: Subject the task belongs to (optional)
         
     Returns:
         dict: Confirmation message
     """
     data = load_tracker()
+    now = datetime.now()
     
     entry = {
-        "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "date": now.strftime("%Y-%m-%d %H:%M:%S"),
+        "timestamp": int(now.timestamp()),
         "task": task,
+        "subject": subject,
         "hours": hours,
         "status": status
     }
@@ -0,0 +1,147 @@
+"""
+Incremental Summarizer Tool - Re-summarize only the changed parts of a PDF
+"""
+
+import hashlib
+import json
+import os
+
+from tools.pdf_parser import parse_pdf_pages
+from tools.summarizer import summarize_chunk, summarize_text
+
+
+SUMMARY_CACHE_FILE = "summary_cache.json"
+
+
+def load_cache(cache_file: str = SUMMARY_CACHE_FILE) -> dict:
+    """Load cached page texts and summaries from file"""
+    if os.path.exists(cache_file):
+        with open(cache_file, 'r') as f:
+            return json.load(f)
+    return {"files": {}, "pages": {}, "chunks": {}, "documents": {}}
+
+
+def save_cache(cache: dict, cache_file: str = SUMMARY_CACHE_FILE):
+    """Save the cache, dropping entries no tracked file refers to anymore"""
+    files = cache["files"].values()
+    pages = {h for f in files for h in f["pages"]}
+    chunks = {h for f in files for h in f["chunks"]}
+    documents = {f["document"] for f in files}
+
+    cache["pages"] = {h: t for h, t in cache["pages"].items() if h in pages}
+    cache["chunks"] = {h: s for h, s in cache["chunks"].items() if h in chunks}
+    cache["documents"] = {h: s for h, s in cache["documents"].items() if h in documents}
+
+    with open(cache_file, 'w') as f:
+        json.dump(cache, f, indent=2)
+
+
+def group_pages(page_hashes: list, pages_per_chunk: int = 4) -> list:
+    """
+    Split pages into content-defined chunks
+
+    A chunk ends after any page whose hash is divisible by pages_per_chunk,
+    so editing or inserting a page only changes the chunks around it
+    instead of shifting every chunk after it.
+
+    Args:
+        page_hashes: Page content hashes in document order
+        pages_per_chunk: Average number of pages per chunk
+
+    Returns:
+        list: Lists of page hashes, one per chunk
+    """
+    chunks = []
+    current = []
+    for page_hash in page_hashes:
+        current.append(page_hash)
+        if int(page_hash[:8], 16) % pages_per_chunk == 0 or len(current) >= pages_per_chunk * 2:
+            chunks.append(current)
+            current = []
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _digest(hashes: list) -> str:
+    """Combine a list of hashes into one"""
+    return hashlib.sha256("".join(hashes).encode("utf-8")).hexdigest()
+
+
+def summarize_pdf_incremental(model, pdf_path: str, pages_per_chunk: int = 4,
+                              cache_file: str = SUMMARY_CACHE_FILE) -> dict:
+    """
+    Summarize a PDF, reusing stored summaries for unchanged pages
+
+    Pages are hashed on every run, but only new or edited pages are
+    extracted, and only the chunks containing them are summarized again
+    before the chunk summaries are combined.
+
+    Args:
+        model: Gemini model instance
+        pdf_path: Path to the PDF file
+        pages_per_chunk: Average number of pages summarized together
+        cache_file: Where page texts and summaries are stored
+
+    Returns:
+        dict: Summary plus counts of changed pages and re-summarized chunks
+    """
+    cache = load_cache(cache_file)
+
+    parsed = parse_pdf_pages(pdf_path, known_hashes=set(cache["pages"]))
+    if not parsed.get("success"):
+        return {
+            "type": "summary",
+            "success": False,
+            "error": parsed.get("error")
+        }
+
+    pages = parsed["pages"]
+    changed_pages = 0
+    for page in pages:
+        if page["text"] is not None:
+            cache["pages"][page["hash"]] = page["text"]
+            changed_pages += 1
+
+    chunks = group_pages([page["hash"] for page in pages], pages_per_chunk)
+    chunk_hashes = [_digest(chunk) for chunk in chunks]
+    doc_hash = _digest(chunk_hashes)
+    summarized_chunks = 0
+
+    try:
+        if doc_hash not in cache["documents"]:
+            if len(chunks) == 1:
+                # Short document: a single summarize call is enough
+                text = "\n".join(cache["pages"][h] for h in chunks[0])
+                cache["documents"][doc_hash] = summarize_text(model, text)["content"]
+                summarized_chunks = 1
+            else:
+                summaries = []
+                for chunk, chunk_hash in zip(chunks, chunk_hashes):
+                    if chunk_hash not in cache["chunks"]:
+                        text = "\n".join(cache["pages"][h] for h in chunk).strip()
+                        cache["chunks"][chunk_hash] = summarize_chunk(model, text)["content"] if text else ""
+                        summarized_chunks += 1
+                    summaries.append(cache["chunks"][chunk_hash])
+
+                combined = "\n\n".join(s for s in summaries if s)
+                cache["documents"][doc_hash] = summarize_text(model, combined)["content"]
+    finally:
+        # Keep whatever was summarized, even if a later call failed
+        cache["files"][os.path.abspath(pdf_path)] = {
+            "pages": [page["hash"] for page in pages],
+            "chunks": chunk_hashes,
+            "document": doc_hash
+        }
+        save_cache(cache, cache_file)
+
+    return {
+        "type": "summary",
+        "success": True,
+        "content": cache["documents"][doc_hash],
+        "doc_id": doc_hash[:10],
+        "num_pages": len(pages),
+        "changed_pages": changed_pages,
+        "num_chunks": len(chunks),
+        "summarized_chunks": summarized_chunks
+    }
@@ -2,7 +2,14 @@
 PDF Parser Tool - Extract text from PDF files
 """
 
-from pypdf import PdfReader
+import hashlib
+
+from pypdf import PageObject, PdfReader
+from pypdf.generic import IndirectObject
+
+
+# Page attributes a page can inherit from its ancestors in the page tree
+INHERITED_PAGE_KEYS = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
 
 
 def parse_pdf(pdf_path: str) -> dict:
@@ -18,15 +25,13 @@ def parse_pdf(pdf_path: str) -> dict:
     try:
         reader = PdfReader(pdf_path)
         
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
+        text = "\n".join(page.extract_text() for page in reader.pages).strip()
         
         return {
             "type": "pdf_content",
             "success": True,
             "num_pages": len(reader.pages),
-            "text": text.strip(),
+            "text": text,
             "char_count": len(text)
         }
     except Exception as e:
@@ -37,6 +42,171 @@ def parse_pdf(pdf_path: str) -> dict:
         }
 
 
+def _walk_page_tree(reader, node_ref, inherit: dict, ancestors: set):
+    """
+    Yield the pages below a page tree node, one at a time
+    
+    Unlike reader.pages, this never builds the list of every page object.
+    
+    Args:
+        reader: PdfReader instance
+        node_ref: Page tree node (or a reference to it)
+        inherit: Attributes inherited from ancestor nodes
+        ancestors: Nodes on the current path (guards against cycles)
+        
+    Yields:
+        PageObject: Each page, in document order
+    """
+    node = node_ref.get_object()
+    if "/Kids" not in node:
+        reference = node_ref if isinstance(node_ref, IndirectObject) else None
+        page = PageObject(reader, reference)
+        page.update(inherit)
+        page.update(node)
+        yield page
+        return
+    
+    key = (node_ref.idnum, node_ref.generation) if isinstance(node_ref, IndirectObject) else id(node)
+    if key in ancestors:
+        return
+    ancestors.add(key)
+    inherit = {**inherit, **{k: node[k] for k in INHERITED_PAGE_KEYS if k in node}}
+    for kid in node["/Kids"]:
+        yield from _walk_page_tree(reader, kid, inherit, ancestors)
+    ancestors.discard(key)
+
+
+def iter_pdf_pages(pdf_path: str, release_every: int = 20):
+    """
+    Yield the text of a PDF one page at a time
+    
+    The file is read lazily from disk, the page tree is walked without
+    building pypdf's list of all pages, and pypdf's object cache is
+    released periodically. The only memory that still grows with the
+    page count is the cross-reference table pypdf reads when opening the
+    file (well under 1 KB per page).
+    
+    Args:
+        pdf_path: Path to the PDF file
+        release_every: Pages between object cache releases
+        
+    Yields:
+        str: Text of each page, in order
+    """
+    with open(pdf_path, 'rb') as f:
+        reader = PdfReader(f)
+        pages = reader.trailer["/Root"].get_object()["/Pages"]
+        for index, page in enumerate(_walk_page_tree(reader, pages, {}, set())):
+            yield page.extract_text() or ""
+            if (index + 1) % release_every == 0:
+                reader.resolved_objects.clear()
+
+
+def _hash_resources(resources, digest, seen: set):
+    """
+    Add the parts of a resource dictionary that affect extracted text to a digest
+    
+    Form XObjects are hashed with their content streams and nested resources,
+    fonts by the entries that decide how glyphs map to text.
+    
+    Args:
+        resources: /Resources dictionary (or None)
+        digest: hashlib object to update
+        seen: IDs of objects already hashed (guards against cycles)
+    """
+    if resources is None:
+        return
+    resources = resources.get_object()
+    
+    xobjects = resources.get("/XObject")
+    if xobjects is not None:
+        xobjects = xobjects.get_object()
+        for name in sorted(xobjects):
+            xobject = xobjects[name].get_object()
+            digest.update(f"xobject {name}".encode())
+            if id(xobject) in seen:
+                continue
+            seen.add(id(xobject))
+            if xobject.get("/Subtype") == "/Form":
+                digest.update(xobject.get_data())
+                _hash_resources(xobject.get("/Resources"), digest, seen)
+            else:
+                # Images don't change the text, their size is enough to tell them apart
+                digest.update(str(xobject.get("/Length")).encode())
+    
+    fonts = resources.get("/Font")
+    if fonts is not None:
+        fonts = fonts.get_object()
+        for name in sorted(fonts):
+            font = fonts[name].get_object()
+            for key in ("/Subtype", "/BaseFont", "/Encoding"):
+                digest.update(f"font {name} {key} {font.get(key)}".encode())
+            to_unicode = font.get("/ToUnicode")
+            if to_unicode is not None:
+                digest.update(to_unicode.get_object().get_data())
+
+
+def hash_pdf_page(page) -> str:
+    """
+    Hash the content of a PDF page
+    
+    Covers the page's content stream plus the form XObjects and fonts it
+    draws with, so text placed inside shared forms is told apart too.
+    
+    Args:
+        page: pypdf page object
+        
+    Returns:
+        str: Hex digest that changes whenever the page content changes
+    """
+    digest = hashlib.sha256()
+    contents = page.get_contents()
+    digest.update(contents.get_data() if contents is not None else b"")
+    _hash_resources(page.get("/Resources"), digest, set())
+    return digest.hexdigest()
+
+
+def parse_pdf_pages(pdf_path: str, known_hashes=None) -> dict:
+    """
+    Hash every page of a PDF and extract text only for unknown pages
+    
+    Args:
+        pdf_path: Path to the PDF file
+        known_hashes: Page hashes whose text is already available (optional)
+        
+    Returns:
+        dict: Per-page hashes, with text for pages that were extracted
+    """
+    known_hashes = known_hashes or set()
+    try:
+        reader = PdfReader(pdf_path)
+        
+        pages = []
+        for number, page in enumerate(reader.pages, start=1):
+            page_hash = hash_pdf_page(page)
+            text = None
+            if page_hash not in known_hashes:
+                text = page.extract_text() or ""
+            pages.append({
+                "number": number,
+                "hash": page_hash,
+                "text": text
+            })
+        
+        return {
+            "type": "pdf_pages",
+            "success": True,
+            "num_pages": len(pages),
+            "pages": pages
+        }
+    except Exception as e:
+        return {
+            "type": "pdf_pages",
+            "success": False,
+            "error": str(e)
+        }
+
+
 def get_pdf_metadata(pdf_path: str) -> dict:
     """
     Get PDF metadata
@@ -0,0 +1,147 @@
+"""
+Prefetch Tool - Generate likely follow-up quizzes and flashcards in the background
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from tools.quiz_generation import generate_quiz, generate_flashcards
+
+
+PREFETCH_KINDS = {
+    "quiz": generate_quiz,
+    "flashcards": generate_flashcards
+}
+
+
+class Prefetcher:
+    """Speculatively generates follow-ups for the latest summary"""
+
+    def __init__(self, model, budget: int = 0):
+        """
+        Initialize the prefetcher
+
+        Args:
+            model: Gemini model instance
+            budget: Maximum number of speculative generations per session (0 disables)
+        """
+        self.model = model
+        self.budget = budget
+        self.spent = 0
+        self.pending = {}
+        self.metrics = {
+            "hits": 0,
+            "misses": 0,
+            "cancelled": 0,
+            "wasted": 0
+        }
+        # A single worker keeps prefetching from competing with foreground requests
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether prefetching is turned on"""
+        return self.budget > 0
+
+    def schedule(self, key: str, topic: str, source: str = None):
+        """
+        Queue quiz and flashcard generation for content just shown to the user
+
+        Args:
+            key: ID of the content (e.g. session memory document ID)
+            topic: Topic passed to the generators
+            source: Study material passed to the generators (optional)
+        """
+        if not self.enabled:
+            return
+
+        # Anything queued for older content is no longer likely to be used
+        self.cancel(keep=key)
+
+        for kind, generate in PREFETCH_KINDS.items():
+            if self.spent >= self.budget:
+                break
+            if (kind, key) in self.pending:
+                continue
+            self.pending[(kind, key)] = self.executor.submit(generate, self.model, topic, source=source)
+            self.spent += 1
+
+    def get(self, kind: str, key: str, timeout: float = None) -> dict:
+        """
+        Take a prefetched result, waiting for it if it is already being generated
+
+        Args:
+            kind: "quiz" or "flashcards"
+            key: ID of the content
+            timeout: Longest time to wait in seconds (None waits until done)
+
+        Returns:
+            dict: Generated result, or None on a miss (the caller generates it)
+        """
+        if not self.enabled:
+            return None
+
+        future = self.pending.pop((kind, key), None)
+        if future is None or future.cancelled():
+            self.metrics["misses"] += 1
+            return None
+
+        if not future.running() and not future.done() and future.cancel():
+            # Still queued (e.g. behind the other kind): generating it in the
+            # foreground is faster than waiting for the worker to get to it
+            self.metrics["cancelled"] += 1
+            self.metrics["misses"] += 1
+            self.spent -= 1
+            return None
+
+        try:
+            result = future.result(timeout=timeout)
+        except Exception:
+            self.metrics["misses"] += 1
+            return None
+
+        self.metrics["hits"] += 1
+        return result
+
+    def record_miss(self):
+        """Count a request that skipped prefetched work still pending (call before cancel())"""
+        if self.enabled and self.pending:
+            self.metrics["misses"] += 1
+
+    def cancel(self, keep: str = None):
+        """
+        Drop prefetched work the user is no longer heading towards
+
+        Args:
+            keep: Content ID whose work should be kept (optional)
+        """
+        for (kind, key), future in list(self.pending.items()):
+            if key == keep:
+                continue
+            if future.cancel():
+                # Never started, so it did not use any quota
+                self.metrics["cancelled"] += 1
+                self.spent -= 1
+            else:
+                self.metrics["wasted"] += 1
+            del self.pending[(kind, key)]
+
+    def stats(self) -> dict:
+        """
+        Get prefetch hit-rate metrics
+
+        Returns:
+            dict: Hits, misses, hit rate and how much of the budget was used
+        """
+        lookups = self.metrics["hits"] + self.metrics["misses"]
+        return {
+            "type": "prefetch_stats",
+            **self.metrics,
+            "hit_rate": self.metrics["hits"] / lookups if lookups else 0.0,
+            "spent": self.spent,
+            "budget": self.budget
+        }
+
+    def shutdown(self):
+        """Cancel queued work and stop the background worker"""
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
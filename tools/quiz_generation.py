@@ -5,7 +5,17 @@ Quiz Generator Tool - Creates MCQs, flashcards, and practice tests
 import google.generativeai as genai
 
 
-def generate_quiz(model, topic: str, num_mcqs: int = 5) -> dict:
+def _format_source(source: str) -> str:
+    """Format optional study material for inclusion in a prompt"""
+    if not source:
+        return ""
+    return f"""
+Base the questions on this study material:
+{source}
+"""
+
+
+def generate_quiz(model, topic: str, num_mcqs: int = 5, source: str = None) -> dict:
     """
     Generate MCQs, flashcards, and practice questions
     
@@ -13,13 +23,14 @@ def generate_quiz(model, topic: str, num_mcqs: int = 5) -> dict:
         model: Gemini model instance
         topic: Topic for quiz generation
         num_mcqs: Number of MCQs to generate
+        source: Study material to base the questions on (optional)
         
     Returns:
         dict: Contains MCQs, flashcards, and practice test
     """
     prompt = f"""
 You are a study assistant creating a quiz on "{topic}".
-
+{_format_source(source)}
 Generate the following:
 
 1. **MCQs** ({num_mcqs} questions)
@@ -44,7 +55,7 @@ Make questions challenging but appropriate for students.
     }
 
 
-def generate_flashcards(model, topic: str, num_cards: int = 10) -> dict:
+def generate_flashcards(model, topic: str, num_cards: int = 10, source: str = None) -> dict:
     """
     Generate flashcards only
     
@@ -52,13 +63,14 @@ def generate_flashcards(model, topic: str, num_cards: int = 10) -> dict:
         model: Gemini model instance
         topic: Topic for flashcard generation
         num_cards: Number of flashcards
+        source: Study material to base the cards on (optional)
         
     Returns:
         dict: Contains flashcards
     """
     prompt = f"""
 Create {num_cards} flashcards on "{topic}".
-
+{_format_source(source)}
 Format each as:
 **Card [number]:**
 Q: [Question]
@@ -0,0 +1,184 @@
+"""
+Session Memory Tool - Keep conversation context within a fixed token budget
+"""
+
+import hashlib
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the number of tokens in a text
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        int: Approximate token count (about 4 characters per token)
+    """
+    return len(text or "") // 4 + 1
+
+
+class SessionMemory:
+    """Per-session memory of recent turns and parsed documents"""
+
+    def __init__(self, model, max_tokens: int = 2000, keep_recent: int = 4,
+                 max_turn_chars: int = 600):
+        """
+        Initialize an empty session
+
+        Args:
+            model: Gemini model instance (used to compact older turns)
+            max_tokens: Token budget for the context sent with each prompt
+            keep_recent: Number of latest turns that are never compacted
+            max_turn_chars: Longest text kept verbatim for a single turn
+        """
+        self.model = model
+        self.max_tokens = max_tokens
+        self.keep_recent = keep_recent
+        self.max_turn_chars = max_turn_chars
+
+        self.summary = ""
+        self.turns = []
+        self.documents = {}
+        self.last_doc_id = None
+
+    def add_document(self, source: str, text: str = "", summary: str = "",
+                     doc_id: str = None) -> str:
+        """
+        Store a parsed document once so later turns can refer to it by ID
+
+        Args:
+            source: Where the document came from (file path, URL, topic)
+            text: Full extracted text (optional)
+            summary: Generated summary of the document (optional)
+            doc_id: Explicit ID, defaults to a hash of the source and text
+
+        Returns:
+            str: Document ID
+        """
+        if not doc_id:
+            digest = hashlib.sha1(f"{source}\n{text}".encode("utf-8"))
+            doc_id = digest.hexdigest()[:10]
+
+        self.documents[doc_id] = {
+            "source": source,
+            "text": text,
+            "summary": summary
+        }
+        self.last_doc_id = doc_id
+        return doc_id
+
+    def get_document(self, doc_id: str = None) -> dict:
+        """
+        Get a stored document (the most recent one by default)
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            dict: Document entry, or None if unknown
+        """
+        return self.documents.get(doc_id or self.last_doc_id)
+
+    def add_turn(self, role: str, content: str, doc_id: str = None):
+        """
+        Record a conversation turn and compact older turns if needed
+
+        Args:
+            role: "user" or "assistant"
+            content: Turn text
+            doc_id: Document the turn refers to (optional)
+        """
+        content = content or ""
+        if len(content) > self.max_turn_chars:
+            content = content[:self.max_turn_chars] + "..."
+
+        self.turns.append({
+            "role": role,
+            "content": content,
+            "doc_id": doc_id
+        })
+        self._compact()
+
+    def get_context(self, include_latest: bool = True) -> str:
+        """
+        Build the context block to prepend to prompts
+
+        Args:
+            include_latest: Include the most recent turn (leave it out when
+                the caller sends that message in full itself)
+
+        Returns:
+            str: Running summary and recent turns (empty if nothing yet)
+        """
+        parts = []
+        if self.summary:
+            parts.append(f"Earlier in this session: {self.summary}")
+
+        turns = self.turns if include_latest else self.turns[:-1]
+        for turn in turns:
+            parts.append(self._format_turn(turn))
+
+        return "\n".join(parts)
+
+    def token_count(self) -> int:
+        """Approximate token size of the current context"""
+        return estimate_tokens(self.get_context())
+
+    def clear(self):
+        """Forget everything in this session"""
+        self.summary = ""
+        self.turns = []
+        self.documents = {}
+        self.last_doc_id = None
+
+    def _format_turn(self, turn: dict) -> str:
+        """Format a turn, referencing documents by ID instead of text"""
+        line = f"{turn['role'].capitalize()}: {turn['content']}"
+        doc = self.documents.get(turn.get("doc_id"))
+        if doc:
+            line += f" [document {turn['doc_id']}: {doc['source']}]"
+        return line
+
+    def _compact(self):
+        """Fold the oldest turns into the running summary until within budget"""
+        if self.token_count() <= self.max_tokens or len(self.turns) <= self.keep_recent:
+            return
+
+        # Compact down to half the budget so the next few turns need no API call
+        count = 0
+        remaining = sum(estimate_tokens(self._format_turn(t)) for t in self.turns)
+        while remaining > self.max_tokens // 2 and len(self.turns) - count > self.keep_recent:
+            remaining -= estimate_tokens(self._format_turn(self.turns[count]))
+            count += 1
+
+        old_turns = self.turns[:count]
+        self.turns = self.turns[count:]
+        self.summary = self._summarize_turns(old_turns)
+
+        # Keep the summary itself from eating the whole budget
+        max_summary_chars = self.max_tokens * 2
+        if len(self.summary) > max_summary_chars:
+            self.summary = self.summary[-max_summary_chars:]
+
+    def _summarize_turns(self, turns: list) -> str:
+        """Merge turns into the running summary using Gemini"""
+        transcript = "\n".join(self._format_turn(t) for t in turns)
+        prompt = f"""
+You maintain the memory of a study assistant conversation.
+Update the running summary with the new turns below.
+Keep topics studied, documents referenced (with their IDs) and open requests.
+Answer with at most 5 short sentences.
+
+RUNNING SUMMARY:
+{self.summary or "(empty)"}
+
+NEW TURNS:
+{transcript}
+"""
+        try:
+            response = self.model.generate_content(prompt)
+            return response.text.strip()
+        except Exception:
+            # Fall back to keeping the raw turns if the model call fails
+            return (self.summary + "\n" + transcript).strip()
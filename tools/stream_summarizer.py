@@ -0,0 +1,196 @@
+"""
+Stream Summarizer Tool - Summarize very large PDFs page by page
+"""
+
+import json
+import re
+import tempfile
+
+from tools.pdf_parser import iter_pdf_pages
+from tools.summarizer import summarize_chunk, summarize_text
+
+
+DEFAULT_SPILL_MB = 16
+CHUNK_CHARS = 12000
+
+
+def clean_pages(pages):
+    """
+    Normalize whitespace and drop empty pages
+
+    Args:
+        pages: Iterable of page texts
+
+    Yields:
+        str: Cleaned page text
+    """
+    for text in pages:
+        text = re.sub(r"[ \t]+", " ", text)
+        text = re.sub(r"\n\s*\n+", "\n\n", text).strip()
+        if text:
+            yield text
+
+
+def chunk_text(texts, max_chars: int = CHUNK_CHARS):
+    """
+    Group texts into chunks of at most max_chars characters
+
+    Args:
+        texts: Iterable of texts (pages or summaries)
+        max_chars: Largest chunk size
+
+    Yields:
+        str: Chunk text
+    """
+    current = []
+    size = 0
+    for text in texts:
+        if len(text) > max_chars:
+            # Flush what is buffered first so chunks stay in document order
+            if current:
+                yield "\n".join(current)
+                current = []
+                size = 0
+            # Split texts that are larger than a chunk on their own
+            while len(text) > max_chars:
+                yield text[:max_chars]
+                text = text[max_chars:]
+        if size + len(text) > max_chars and current:
+            yield "\n".join(current)
+            current = []
+            size = 0
+        current.append(text)
+        size += len(text) + 1
+    if current:
+        yield "\n".join(current)
+
+
+def summarize_chunks(model, chunks):
+    """
+    Summarize each chunk (map step)
+
+    Args:
+        model: Gemini model instance
+        chunks: Iterable of chunk texts
+
+    Yields:
+        str: Chunk summary
+    """
+    for chunk in chunks:
+        yield summarize_chunk(model, chunk)["content"]
+
+
+def spill(texts, spill_bytes: int):
+    """
+    Store texts in a temporary file that moves to disk once it gets large
+
+    Args:
+        texts: Iterable of texts
+        spill_bytes: Size kept in memory before spilling to disk
+
+    Returns:
+        tuple: (temporary file, number of texts, total characters)
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=spill_bytes, mode='w+', encoding='utf-8')
+    count = 0
+    total = 0
+    for text in texts:
+        spool.write(json.dumps(text) + "\n")
+        count += 1
+        total += len(text)
+    spool.seek(0)
+    return spool, count, total
+
+
+def read_spill(spool):
+    """
+    Read texts back from a temporary file written by spill()
+
+    Args:
+        spool: Temporary file
+
+    Yields:
+        str: Stored texts, in order
+    """
+    for line in spool:
+        yield json.loads(line)
+
+
+def summarize_pdf_streaming(model, pdf_path: str, spill_mb: int = DEFAULT_SPILL_MB,
+                            chunk_chars: int = CHUNK_CHARS) -> dict:
+    """
+    Summarize a PDF as a streaming pipeline
+
+    Pages are extracted, cleaned, chunked and summarized one at a time, so
+    the full document text is never held in memory. Chunk summaries are
+    spilled to a temporary file once they exceed spill_mb and reduced in
+    rounds until they fit into one final summary.
+
+    Args:
+        model: Gemini model instance
+        pdf_path: Path to the PDF file
+        spill_mb: Size of intermediate summaries kept in memory before spilling to disk
+        chunk_chars: Largest amount of text sent in a single request
+
+    Returns:
+        dict: Summary plus page and chunk counts
+    """
+    spill_bytes = spill_mb * 1024 * 1024
+    num_pages = 0
+
+    def count_pages(pages):
+        nonlocal num_pages
+        for text in pages:
+            num_pages += 1
+            yield text
+
+    spool = None
+    try:
+        pages = clean_pages(count_pages(iter_pdf_pages(pdf_path)))
+        spool, num_chunks, total = spill(
+            summarize_chunks(model, chunk_text(pages, chunk_chars)),
+            spill_bytes
+        )
+
+        # Reduce the summaries in rounds until they fit into a single request
+        count = num_chunks
+        while total > chunk_chars and count > 1:
+            previous, previous_count = spool, count
+            spool, count, total = spill(
+                summarize_chunks(model, chunk_text(read_spill(previous), chunk_chars)),
+                spill_bytes
+            )
+            previous.close()
+            if count >= previous_count:
+                # Summaries are not getting shorter, stop instead of looping forever
+                break
+
+        # Cap each summary so the final request stays within chunk_chars even
+        # when the reduce rounds stopped early
+        per_summary = max(1, chunk_chars // max(count, 1)) if total > chunk_chars else None
+        combined = "\n\n".join(text[:per_summary] for text in read_spill(spool))
+
+        if not combined:
+            return {
+                "type": "summary",
+                "success": False,
+                "error": "No text could be extracted from the PDF"
+            }
+
+        result = summarize_text(model, combined)
+        return {
+            "type": "summary",
+            "success": True,
+            "content": result["content"],
+            "num_pages": num_pages,
+            "num_chunks": num_chunks
+        }
+    except Exception as e:
+        return {
+            "type": "summary",
+            "success": False,
+            "error": str(e)
+        }
+    finally:
+        if spool is not None:
+            spool.close()
@@ -0,0 +1,273 @@
+"""
+Study Analytics Tool - Streaks, weekly hours and subject breakdowns from tracker history
+"""
+
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+
+from tools.habit_tracker import TRACKER_FILE, load_tracker
+
+
+HISTORY_CACHE_FILE = "study_progress_history.npz"
+SECONDS_PER_DAY = 86400
+OTHER_SUBJECT = "Other"
+HISTORY_COLUMNS = ("timestamps", "hours", "task_ids", "task_names", "subject_ids", "subject_names")
+
+
+def _utc_offset() -> int:
+    """Local UTC offset in seconds"""
+    return time.localtime().tm_gmtoff
+
+
+def _factorize(values: list) -> tuple:
+    """Turn a list of strings into integer codes and the list of distinct names"""
+    names, codes = np.unique(np.array(values, dtype=str), return_inverse=True)
+    return codes.astype(np.int32), names
+
+
+def _subject_names(entries: list) -> list:
+    """
+    Normalized subject of every entry
+
+    Subjects are matched ignoring case and extra whitespace and shown with
+    their first spelling; entries without a subject go under "Other".
+    """
+    display = {}
+    subjects = []
+    for e in entries:
+        name = " ".join((e.get("subject") or "").split()) or OTHER_SUBJECT
+        subjects.append(display.setdefault(name.casefold(), name))
+    return subjects
+
+
+def _parse_dates(dates: list) -> np.ndarray:
+    """
+    Parse formatted date strings, with NaT for the ones that are malformed
+
+    Args:
+        dates: Date strings like "2024-01-31 18:00:00"
+
+    Returns:
+        np.ndarray: datetime64[s] values
+    """
+    try:
+        return np.array(dates, dtype="datetime64[s]")
+    except ValueError:
+        # Only fall back to parsing one by one when something is malformed
+        parsed = np.empty(len(dates), dtype="datetime64[s]")
+        for i, date in enumerate(dates):
+            try:
+                parsed[i] = np.datetime64(date, "s")
+            except (ValueError, TypeError):
+                parsed[i] = np.datetime64("NaT")
+        return parsed
+
+
+def _build_history(entries: list) -> dict:
+    """Build the columnar arrays from tracker entries"""
+    timestamps = np.array([e.get("timestamp", -1) for e in entries], dtype=np.int64)
+    valid = np.ones(len(entries), dtype=bool)
+
+    # Older entries only have a formatted local date string
+    missing = np.flatnonzero(timestamps < 0)
+    if missing.size:
+        dates = _parse_dates([entries[i].get("date") or "" for i in missing])
+        bad = np.isnat(dates)
+        valid[missing[bad]] = False
+        timestamps[missing[~bad]] = dates[~bad].astype(np.int64) - _utc_offset()
+
+    # Entries whose date can't be read are left out rather than failing the report
+    if not valid.all():
+        entries = [e for e, ok in zip(entries, valid) if ok]
+        timestamps = timestamps[valid]
+
+    hours = np.array([e.get("hours") or 0 for e in entries], dtype=np.float64)
+    task_ids, task_names = _factorize([e.get("task", "") for e in entries])
+    subject_ids, subject_names = _factorize(_subject_names(entries))
+
+    return {
+        "timestamps": timestamps,
+        "hours": hours,
+        "task_ids": task_ids,
+        "task_names": task_names,
+        "subject_ids": subject_ids,
+        "subject_names": subject_names
+    }
+
+
+def load_history(entries: list = None, cache_file: str = HISTORY_CACHE_FILE) -> dict:
+    """
+    Load tracker entries into columnar NumPy arrays
+
+    When reading the saved tracker file, the arrays are cached in cache_file
+    and reused until the tracker file changes, so repeated reports skip
+    parsing the JSON and rebuilding the columns.
+
+    Args:
+        entries: Tracker entries (defaults to the saved tracker file)
+        cache_file: Where the columns of the saved tracker file are cached
+
+    Returns:
+        dict: Arrays of epoch timestamps, hours and categorical task/subject IDs
+    """
+    if entries is not None:
+        return _build_history(entries)
+
+    if not os.path.exists(TRACKER_FILE):
+        return _build_history([])
+
+    stat = os.stat(TRACKER_FILE)
+    version = np.array([stat.st_mtime_ns, stat.st_size], dtype=np.int64)
+
+    if os.path.exists(cache_file):
+        try:
+            with np.load(cache_file, allow_pickle=False) as cached:
+                if np.array_equal(cached["version"], version):
+                    return {name: cached[name] for name in HISTORY_COLUMNS}
+        except (OSError, ValueError, KeyError):
+            pass  # Unreadable cache, rebuild it below
+
+    history = _build_history(load_tracker().get("entries", []))
+    try:
+        with open(cache_file, 'wb') as f:
+            np.savez(f, version=version, **history)
+    except OSError:
+        pass  # Caching is only an optimization
+    return history
+
+
+def summarize_progress(history: dict, recent: int = 10) -> dict:
+    """
+    Totals and most recent entries, in the same shape as get_progress()
+
+    Args:
+        history: Columnar history from load_history()
+        recent: Number of latest entries to include
+
+    Returns:
+        dict: Total tasks, total hours and the latest entries
+    """
+    start = max(0, history["hours"].size - recent)
+    entries = [
+        {
+            "date": datetime.fromtimestamp(int(history["timestamps"][i])).strftime("%Y-%m-%d %H:%M:%S"),
+            "task": str(history["task_names"][history["task_ids"][i]]),
+            "hours": float(history["hours"][i]) or None
+        }
+        for i in range(start, history["hours"].size)
+    ]
+    return {
+        "type": "progress",
+        "total_tasks": int(history["hours"].size),
+        "total_hours": float(history["hours"].sum()),
+        "entries": entries
+    }
+
+
+def compute_streaks(days: np.ndarray, today: int) -> tuple:
+    """
+    Compute the current and longest run of consecutive study days
+
+    Args:
+        days: Local day numbers of all entries
+        today: Local day number of today
+
+    Returns:
+        tuple: (current streak, longest streak) in days
+    """
+    if days.size == 0:
+        return 0, 0
+
+    # Distinct study days via a presence count, which avoids sorting every entry
+    first = days.min()
+    days = np.flatnonzero(np.bincount(days - first)) + first
+
+    # Runs end wherever the gap to the next study day is more than one day
+    breaks = np.flatnonzero(np.diff(days) != 1) + 1
+    run_lengths = np.diff(np.concatenate(([0], breaks, [days.size])))
+
+    longest = int(run_lengths.max())
+    current = int(run_lengths[-1]) if days[-1] >= today - 1 else 0
+    return current, longest
+
+
+def daily_hours(days: np.ndarray, hours: np.ndarray, today: int, num_days: int) -> np.ndarray:
+    """
+    Total hours per day for the last num_days days (oldest first)
+
+    Args:
+        days: Local day numbers of all entries
+        hours: Hours of all entries
+        today: Local day number of today
+        num_days: Number of days to include
+
+    Returns:
+        np.ndarray: Hours per day
+    """
+    offsets = days - (today - num_days + 1)
+    in_range = (offsets >= 0) & (offsets < num_days)
+    return np.bincount(offsets[in_range], weights=hours[in_range], minlength=num_days)
+
+
+def build_report(history: dict = None, weekly_goal_hours: float = 10.0,
+                 weeks: int = 8, now: float = None) -> dict:
+    """
+    Build a study analytics report
+
+    Args:
+        history: Columnar history from load_history() (loaded if omitted)
+        weekly_goal_hours: Target study hours per 7 days
+        weeks: Number of weeks in the weekly hours breakdown
+        now: Epoch time to report at (defaults to the current time)
+
+    Returns:
+        dict: Streaks, rolling weekly hours, subject distribution and goal progress
+    """
+    if history is None:
+        history = load_history()
+    if now is None:
+        now = time.time()
+
+    offset = _utc_offset()
+    days = (history["timestamps"] + offset) // SECONDS_PER_DAY
+    today = int((now + offset) // SECONDS_PER_DAY)
+    hours = history["hours"]
+
+    current_streak, longest_streak = compute_streaks(days, today)
+
+    daily = daily_hours(days, hours, today, weeks * 7)
+    # Rolling 7-day totals ending on each day, and totals per 7-day block
+    rolling = np.convolve(daily, np.ones(7))[:daily.size]
+    weekly = daily.reshape(weeks, 7).sum(axis=1)
+
+    subject_hours = np.bincount(history["subject_ids"], weights=hours,
+                                minlength=history["subject_names"].size)
+    order = np.argsort(subject_hours)[::-1]
+    total_hours = float(hours.sum())
+    subjects = [
+        {
+            "subject": str(history["subject_names"][i]),
+            "hours": float(subject_hours[i]),
+            "share": float(subject_hours[i] / total_hours) if total_hours else 0.0
+        }
+        for i in order if subject_hours[i] > 0
+    ]
+
+    last_7_days = float(rolling[-1]) if rolling.size else 0.0
+
+    return {
+        "type": "analytics",
+        "total_entries": int(hours.size),
+        "total_hours": total_hours,
+        "current_streak": current_streak,
+        "longest_streak": longest_streak,
+        "last_7_days_hours": last_7_days,
+        "rolling_weekly_hours": rolling.tolist(),
+        "weekly_hours": weekly.tolist(),
+        "subjects": subjects,
+        "weekly_goal_hours": weekly_goal_hours,
+        "goal_progress": last_7_days / weekly_goal_hours if weekly_goal_hours else 0.0
+    }
@@ -68,3 +68,28 @@ Be clear, concise, and student-friendly.
         "content": response.text
     }
 
+
+def summarize_chunk(model, text: str) -> dict:
+    """
+    Summarize one section of a longer document (map step)
+    
+    Args:
+        model: Gemini model instance
+        text: Section text
+        
+    Returns:
+        dict: Contains a short bullet-point summary of the section
+    """
+    prompt = f"""
+You are a study assistant. This is one section of a longer document.
+Summarize it in 5-8 concise bullet points, keeping key terms, definitions and examples.
+
+SECTION:
+{text}
+"""
+    
+    response = model.generate_content(prompt)
+    return {
+        "type": "chunk_summary",
+        "content": response.text
+    }